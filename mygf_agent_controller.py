@@ -3,15 +3,29 @@ MyGF AI Agent Controller - Maximum Behavior Control
 ====================================================
 This module provides complete control over the AI agent's behavior,
 including intent classification, flow management, tool calling, and response generation.
+
+Expensive setup (pattern compilation and risk analysis, vocabularies, the
+search worker pool) happens on first use. Pre-forking servers should call
+`warmup()` in the parent so workers share the built state copy-on-write.
 """
 
 import re
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Pattern, Match, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
 
 # ============================================================================
 # ENUMS & CONSTANTS
@@ -52,6 +66,13 @@ class BuyingSignal(Enum):
     COMMITMENT_LANGUAGE = "commitment_language"
 
 
+class PatternRisk(Enum):
+    """Worst-case backtracking cost of a regex under re.search"""
+    LINEAR = "linear"
+    QUADRATIC = "quadratic"  # Unbounded repeat followed by more pattern
+    EXPONENTIAL = "exponential"  # Nested unbounded repeats
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -72,6 +93,14 @@ class UserContext:
     additional_preferences: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BackgroundSearch:
+    """A search_properties call running on the search worker pool"""
+    parameters: Dict[str, Any]
+    future: "Future"
+    started_at: float
+
+
 @dataclass
 class ConversationState:
     """Tracks conversation state and history"""
@@ -86,6 +115,52 @@ class ConversationState:
     pending_actions: List[str] = field(default_factory=list)
     qualification_score: int = 0  # 0-100, measures lead quality
     engagement_score: int = 0  # 0-100, measures conversation quality
+    prefetch: Optional[BackgroundSearch] = None
+    wasted_prefetches: int = 0
+    pending_search: Optional[BackgroundSearch] = None  # Search that missed its turn deadline
+    search_retry: bool = False  # Last search failed, retry on the next message
+    deadline_misses: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class GuardedPattern:
+    """A pattern with its risk analysis, compiled on first use"""
+    source: str
+    risk: PatternRisk
+    _compiled: Optional[Pattern] = field(default=None, repr=False)
+
+    @property
+    def regex(self) -> Pattern:
+        if self._compiled is None:
+            self._compiled = re.compile(self.source)
+        return self._compiled
+
+
+@dataclass
+class MatchBudget:
+    """Per-message bookkeeping for bounded pattern matching"""
+    time_budget_ms: Optional[float] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    truncated: bool = False
+    windows_scanned: int = 0
+    skipped_patterns: int = 0
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    @property
+    def exceeded(self) -> bool:
+        return self.time_budget_ms is not None and self.elapsed_ms > self.time_budget_ms
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'truncated': self.truncated,
+            'windows_scanned': self.windows_scanned,
+            'skipped_patterns': self.skipped_patterns,
+            'elapsed_ms': round(self.elapsed_ms, 3),
+            'budget_exceeded': self.exceeded
+        }
 
 
 @dataclass
@@ -97,6 +172,225 @@ class AgentResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# ============================================================================
+# PATTERN MATCHING GUARD
+# ============================================================================
+
+class UnsafePatternError(ValueError):
+    """A pattern table contains a pattern whose backtracking can't be bounded"""
+
+
+class PatternGuard:
+    """Keeps regex matching bounded on long or adversarial messages"""
+
+    MAX_MESSAGE_CHARS = 2000  # Longer messages (pasted listings, spam) are truncated
+    WINDOW_CHARS = 256  # Risky patterns only ever see this much text per search
+    WINDOW_OVERLAP = 64  # Keeps matches that straddle a window boundary
+
+    _REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, 'POSSESSIVE_REPEAT', None))
+
+    @staticmethod
+    def _is_broad(sub) -> bool:
+        """Whether a repeated item matches (almost) any character, like `.`"""
+        items = list(sub)
+        if len(items) != 1:
+            return False
+        op, av = items[0]
+        if op in (sre_parse.ANY, sre_parse.NOT_LITERAL):
+            return True
+        return op == sre_parse.IN and bool(av) and av[0][0] == sre_parse.NEGATE
+
+    @staticmethod
+    def _first_chars(items) -> Optional[set]:
+        """Characters a sequence must start with, or None if unknown or it can match empty"""
+        for op, av in items:
+            if op == sre_parse.AT:
+                continue
+            if op == sre_parse.LITERAL:
+                return {av}
+            if op == sre_parse.IN:
+                chars = set()
+                for item_op, item_av in av:
+                    if item_op == sre_parse.LITERAL:
+                        chars.add(item_av)
+                    elif item_op == sre_parse.RANGE and item_av[1] - item_av[0] < 256:
+                        chars.update(range(item_av[0], item_av[1] + 1))
+                    else:
+                        return None  # Categories and negated sets overlap too much to tell
+                return chars
+            if op == sre_parse.SUBPATTERN:
+                return PatternGuard._first_chars(av[-1])
+            if op == sre_parse.BRANCH:
+                chars = set()
+                for branch in av[1]:
+                    branch_chars = PatternGuard._first_chars(branch)
+                    if branch_chars is None:
+                        return None
+                    chars |= branch_chars
+                return chars
+            if op in PatternGuard._REPEATS and av[0] > 0:
+                return PatternGuard._first_chars(av[2])
+            return None
+        return None
+
+    @staticmethod
+    def _has_ambiguous_branch(items) -> bool:
+        """Whether an alternation has branches that can match the same text, like `a|aa`"""
+        for op, av in items:
+            if op == sre_parse.BRANCH:
+                seen = set()
+                for branch in av[1]:
+                    chars = PatternGuard._first_chars(branch)
+                    if chars is None or chars & seen:
+                        return True
+                    seen |= chars
+                if any(PatternGuard._has_ambiguous_branch(branch) for branch in av[1]):
+                    return True
+            elif op == sre_parse.SUBPATTERN:
+                if PatternGuard._has_ambiguous_branch(av[-1]):
+                    return True
+            elif op in PatternGuard._REPEATS:
+                if PatternGuard._has_ambiguous_branch(av[2]):
+                    return True
+        return False
+
+    @staticmethod
+    def analyse(pattern: str) -> PatternRisk:
+        """Estimate worst-case backtracking of re.search from the parsed pattern.
+
+        - EXPONENTIAL: an unbounded repeat nested in another one (`(a+)+`) or
+          around alternatives that can match the same text (`(a|aa)+`), or a
+          counted repeat around an unbounded one (`(.*,){8}`, degree 8).
+          These are refused by `load_resources()`.
+        - QUADRATIC: an unbounded repeat with more pattern after it that is
+          either broad (`.*`) or reachable from every start offset (nothing
+          but zero-width or optional items before it, e.g. `\\d+\\s*bed`), so
+          each failed attempt rescans the rest of the message.
+        - LINEAR: everything else.
+        """
+        risk = PatternRisk.LINEAR
+
+        def walk(items, followed: bool, leading: bool) -> bool:
+            nonlocal risk
+            has_unbounded = False
+            items = list(items)
+            for index, (op, av) in enumerate(items):
+                item_followed = followed or index < len(items) - 1
+                if op in PatternGuard._REPEATS:
+                    min_count, max_count, sub = av
+                    inner_unbounded = walk(sub, True, leading)
+                    if max_count == sre_parse.MAXREPEAT:
+                        has_unbounded = True
+                        if inner_unbounded or PatternGuard._has_ambiguous_branch(sub):
+                            risk = PatternRisk.EXPONENTIAL
+                        elif item_followed and (leading or PatternGuard._is_broad(sub)):
+                            if risk == PatternRisk.LINEAR:
+                                risk = PatternRisk.QUADRATIC
+                    elif max_count > 1 and inner_unbounded:
+                        risk = PatternRisk.EXPONENTIAL
+                    has_unbounded = has_unbounded or inner_unbounded
+                    leading = leading and min_count == 0
+                elif op == sre_parse.SUBPATTERN:
+                    has_unbounded = walk(av[-1], item_followed, leading) or has_unbounded
+                    leading = False
+                elif op == sre_parse.BRANCH:
+                    for branch in av[1]:
+                        has_unbounded = walk(branch, item_followed, leading) or has_unbounded
+                    leading = False
+                elif op == sre_parse.AT:
+                    # Zero-width, but a start anchor pins the match to one offset
+                    leading = leading and av != sre_parse.AT_BEGINNING
+                else:
+                    leading = False
+            return has_unbounded
+
+        walk(sre_parse.parse(pattern), False, True)
+        return risk
+
+    @staticmethod
+    def compile(pattern: str) -> GuardedPattern:
+        """Guard a pattern; the regex itself is compiled on first search"""
+        return GuardedPattern(source=pattern, risk=PatternGuard.analyse(pattern))
+
+    @staticmethod
+    def compile_table(table: Dict[Any, List[str]]) -> Dict[Any, List[GuardedPattern]]:
+        return {key: [PatternGuard.compile(p) for p in patterns] for key, patterns in table.items()}
+
+    @staticmethod
+    def prepare(message: str, budget: Optional[MatchBudget] = None) -> str:
+        """Truncate before lowercasing so huge messages cost nothing extra"""
+        if len(message) > PatternGuard.MAX_MESSAGE_CHARS:
+            message = message[:PatternGuard.MAX_MESSAGE_CHARS]
+            if budget is not None:
+                budget.truncated = True
+        return message.lower()
+
+    @staticmethod
+    def search(
+        guarded: GuardedPattern,
+        text: str,
+        budget: Optional[MatchBudget] = None
+    ) -> Optional[Match]:
+        """re.search with quadratic patterns confined to overlapping windows.
+
+        A failed search only rescans its own window, so backtracking grows with
+        WINDOW_CHARS rather than with the (truncated) message. Windows start and
+        end at whitespace where possible, and a window hit is re-matched once on
+        the full text so captured values (budgets, bedrooms) and trailing word
+        boundaries are never cut off by the window.
+
+        The time budget is checked between searches: once spent, remaining
+        searches are skipped and counted, but a search already running is not
+        interrupted. Exponential patterns are refused at load time for that
+        reason.
+        """
+        window = PatternGuard.WINDOW_CHARS
+
+        if guarded.risk == PatternRisk.LINEAR or len(text) <= window:
+            if budget is not None:
+                if budget.exceeded:
+                    budget.skipped_patterns += 1
+                    return None
+                budget.windows_scanned += 1
+            return guarded.regex.search(text)
+
+        start = 0
+        while start < len(text):
+            if budget is not None:
+                if budget.exceeded:
+                    budget.skipped_patterns += 1
+                    return None
+                budget.windows_scanned += 1
+
+            end = start + window
+            if end < len(text):
+                end = PatternGuard._last_space(text, start + 1, end) or end
+
+            match = guarded.regex.search(text, start, end)
+            if match:
+                full_match = guarded.regex.match(text, match.start())
+                if full_match:
+                    return full_match
+
+            if end >= len(text):
+                break
+            overlap_start = max(end - PatternGuard.WINDOW_OVERLAP, start + 1)
+            start = PatternGuard._first_space(text, overlap_start, end) or end
+        return None
+
+    @staticmethod
+    def _last_space(text: str, lo: int, hi: int) -> Optional[int]:
+        """Index of the last whitespace in text[lo:hi], if any"""
+        index = max(text.rfind(' ', lo, hi), text.rfind('\n', lo, hi), text.rfind('\t', lo, hi))
+        return index if index >= lo else None
+
+    @staticmethod
+    def _first_space(text: str, lo: int, hi: int) -> Optional[int]:
+        """Index of the first whitespace in text[lo:hi], if any"""
+        found = [i for i in (text.find(' ', lo, hi), text.find('\n', lo, hi), text.find('\t', lo, hi)) if i >= 0]
+        return min(found) if found else None
+
+
 # ============================================================================
 # INTENT CLASSIFICATION ENGINE
 # ============================================================================
@@ -166,57 +460,82 @@ class IntentClassifier:
         ]
     }
 
+    # Entity extraction patterns
+    BEDROOM_PATTERN = r'(\d+)\s*(?:bed|bedroom|br)'
+    BATHROOM_PATTERN = r'(\d+)\s*(?:bath|bathroom)'
+    BUDGET_PATTERNS = [
+        r'(?:under|below|max|maximum|up to)\s*(?:ksh|kes|sh)?\s*([\d,]+)\s*k?',
+        r'(?:ksh|kes|sh)?\s*([\d,]+)\s*k?\s*(?:to|-)\s*(?:ksh|kes|sh)?\s*([\d,]+)\s*k?'
+    ]
+
+    # Location vocabulary (simple - common Nairobi areas)
+    LOCATIONS = [
+        'westlands', 'kilimani', 'kileleshwa', 'lavington', 'parklands',
+        'karen', 'runda', 'spring valley', 'kitisuru', 'muthaiga',
+        'upperhill', 'kilimani', 'nairobi cbd', 'cbd'
+    ]
+
+    PROPERTY_TYPE_KEYWORDS = {
+        'apartment': ['apartment', 'flat'],
+        'house': ['house', 'home', 'bungalow'],
+        'villa': ['villa'],
+        'land': ['land', 'plot'],
+        'commercial': ['commercial', 'office', 'shop']
+    }
+
+    @staticmethod
+    def pattern_risks() -> Dict[str, str]:
+        """Patterns with super-linear backtracking risk, as found when loaded"""
+        resources = load_resources()
+        return {g.source: g.risk.value for g in resources.all_patterns() if g.risk != PatternRisk.LINEAR}
+
     @staticmethod
-    def classify_intent(message: str) -> Intent:
+    def classify_intent(message: str, budget: Optional[MatchBudget] = None) -> Intent:
         """Classify user message into primary intent"""
-        message_lower = message.lower()
+        message_lower = PatternGuard.prepare(message, budget)
 
         # Check each intent pattern
-        for intent, patterns in IntentClassifier.INTENT_PATTERNS.items():
+        for intent, patterns in load_resources().intents.items():
             for pattern in patterns:
-                if re.search(pattern, message_lower):
+                if PatternGuard.search(pattern, message_lower, budget):
                     return intent
 
         return Intent.UNKNOWN
 
     @staticmethod
-    def detect_buying_signals(message: str) -> List[BuyingSignal]:
+    def detect_buying_signals(message: str, budget: Optional[MatchBudget] = None) -> List[BuyingSignal]:
         """Detect buying signals in user message"""
-        message_lower = message.lower()
+        message_lower = PatternGuard.prepare(message, budget)
         signals = []
 
-        for signal, patterns in IntentClassifier.BUYING_SIGNALS.items():
+        for signal, patterns in load_resources().signals.items():
             for pattern in patterns:
-                if re.search(pattern, message_lower):
+                if PatternGuard.search(pattern, message_lower, budget):
                     signals.append(signal)
                     break  # Only add each signal once
 
         return signals
 
     @staticmethod
-    def extract_entities(message: str) -> Dict[str, Any]:
+    def extract_entities(message: str, budget: Optional[MatchBudget] = None) -> Dict[str, Any]:
         """Extract entities like location, budget, bedrooms from message"""
         entities = {}
-        message_lower = message.lower()
+        message_lower = PatternGuard.prepare(message, budget)
+        resources = load_resources()
 
         # Extract bedrooms
-        bedroom_match = re.search(r'(\d+)\s*(?:bed|bedroom|br)', message_lower)
+        bedroom_match = PatternGuard.search(resources.bedrooms, message_lower, budget)
         if bedroom_match:
             entities['bedrooms'] = int(bedroom_match.group(1))
 
         # Extract bathrooms
-        bathroom_match = re.search(r'(\d+)\s*(?:bath|bathroom)', message_lower)
+        bathroom_match = PatternGuard.search(resources.bathrooms, message_lower, budget)
         if bathroom_match:
             entities['bathrooms'] = int(bathroom_match.group(1))
 
         # Extract budget (handle k/K for thousands)
-        budget_patterns = [
-            r'(?:under|below|max|maximum|up to)\s*(?:ksh|kes|sh)?\s*([\d,]+)\s*k?',
-            r'(?:ksh|kes|sh)?\s*([\d,]+)\s*k?\s*(?:to|-)\s*(?:ksh|kes|sh)?\s*([\d,]+)\s*k?'
-        ]
-
-        for pattern in budget_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in resources.budgets:
+            match = PatternGuard.search(pattern, message_lower, budget)
             if match:
                 if len(match.groups()) == 2:  # Range
                     min_val = int(match.group(1).replace(',', ''))
@@ -234,26 +553,14 @@ class IntentClassifier:
                     entities['budget_max'] = max_val
                 break
 
-        # Extract location (simple - look for common Nairobi areas)
-        locations = [
-            'westlands', 'kilimani', 'kileleshwa', 'lavington', 'parklands',
-            'karen', 'runda', 'spring valley', 'kitisuru', 'muthaiga',
-            'upperhill', 'kilimani', 'nairobi cbd', 'cbd'
-        ]
-        for loc in locations:
+        # Extract location
+        for loc in resources.locations:
             if loc in message_lower:
                 entities['location'] = loc.title()
                 break
 
         # Extract property type
-        property_types = {
-            'apartment': ['apartment', 'flat'],
-            'house': ['house', 'home', 'bungalow'],
-            'villa': ['villa'],
-            'land': ['land', 'plot'],
-            'commercial': ['commercial', 'office', 'shop']
-        }
-        for ptype, keywords in property_types.items():
+        for ptype, keywords in resources.property_types.items():
             if any(kw in message_lower for kw in keywords):
                 entities['property_type'] = ptype
                 break
@@ -267,6 +574,84 @@ class IntentClassifier:
         return entities
 
 
+# ============================================================================
+# LAZY RESOURCES & WARMUP
+# ============================================================================
+
+@dataclass
+class ClassifierResources:
+    """Guarded pattern tables and vocabularies used by IntentClassifier"""
+    intents: Dict[Intent, List[GuardedPattern]]
+    signals: Dict[BuyingSignal, List[GuardedPattern]]
+    bedrooms: GuardedPattern
+    bathrooms: GuardedPattern
+    budgets: List[GuardedPattern]
+    locations: List[str]
+    property_types: Dict[str, List[str]]
+
+    def all_patterns(self) -> List[GuardedPattern]:
+        return [
+            *(g for patterns in self.intents.values() for g in patterns),
+            *(g for patterns in self.signals.values() for g in patterns),
+            self.bedrooms,
+            self.bathrooms,
+            *self.budgets
+        ]
+
+
+_resources: Optional[ClassifierResources] = None
+
+
+def load_resources() -> ClassifierResources:
+    """Build classifier resources on first use.
+
+    Raises UnsafePatternError if any pattern can backtrack exponentially:
+    no window or time budget can stop such a search once it has started.
+    """
+    global _resources
+    if _resources is not None:
+        return _resources
+
+    resources = ClassifierResources(
+        intents=PatternGuard.compile_table(IntentClassifier.INTENT_PATTERNS),
+        signals=PatternGuard.compile_table(IntentClassifier.BUYING_SIGNALS),
+        bedrooms=PatternGuard.compile(IntentClassifier.BEDROOM_PATTERN),
+        bathrooms=PatternGuard.compile(IntentClassifier.BATHROOM_PATTERN),
+        budgets=[PatternGuard.compile(p) for p in IntentClassifier.BUDGET_PATTERNS],
+        locations=list(IntentClassifier.LOCATIONS),
+        property_types=dict(IntentClassifier.PROPERTY_TYPE_KEYWORDS)
+    )
+    unsafe = [g.source for g in resources.all_patterns() if g.risk == PatternRisk.EXPONENTIAL]
+    if unsafe:
+        raise UnsafePatternError(
+            "Patterns with exponential backtracking can stall a worker, rewrite them: "
+            + ", ".join(repr(p) for p in unsafe)
+        )
+
+    _resources = resources
+    return _resources
+
+
+def warmup(freeze: bool = True) -> ClassifierResources:
+    """Build all lazy state up front, e.g. in a pre-forking server's parent.
+
+    With `freeze`, the built objects are moved out of the garbage collector's
+    reach so forked workers don't dirty the shared pages while collecting.
+    """
+    import gc
+    import random  # noqa: F401 - used by ResponseGenerator.generate_greeting
+    import concurrent.futures  # noqa: F401 - used by SearchPrefetcher
+
+    resources = load_resources()
+    for guarded in resources.all_patterns():
+        guarded.regex
+
+    if freeze and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+    return resources
+
+
 # ============================================================================
 # CONVERSATION FLOW CONTROLLER
 # ============================================================================
@@ -511,6 +896,296 @@ class ResponseGenerator:
         return responses.get(objection_type, "I hear you. What would help you make a decision?")
 
 
+# ============================================================================
+# BACKGROUND SEARCH & SPECULATIVE PREFETCH
+# ============================================================================
+
+class SearchPrefetcher:
+    """Runs property searches in the background, including speculative prefetches"""
+
+    # Search parameters that may be left open in a prefetch and narrowed later
+    NARROWABLE_PARAMS = ['location', 'price_max', 'property_type', 'bedrooms', 'bathrooms', 'price_type']
+
+    def __init__(
+        self,
+        search_backend: Callable[[Dict[str, Any]], Dict[str, Any]],
+        max_workers: int = 4,
+        max_wasted_per_conversation: int = 2,
+        cache_size: int = 256
+    ):
+        self.search_backend = search_backend
+        self.max_workers = max_workers
+        self.max_wasted_per_conversation = max_wasted_per_conversation
+        self.cache_size = cache_size
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._cache: "OrderedDict[Tuple, List[Dict]]" = OrderedDict()
+        self.stats = {'issued': 0, 'hits': 0, 'wasted': 0, 'replaced': 0, 'skipped': 0}
+
+        # The controller may be called from several threads (e.g. the load simulator);
+        # conversations are not shared between threads, but the pool, cache and stats are.
+        import threading
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> "ThreadPoolExecutor":
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='mygf-prefetch'
+                )
+            return self._executor
+
+    def _count(self, **deltas: int):
+        with self._lock:
+            for key, delta in deltas.items():
+                self.stats[key] += delta
+
+    @staticmethod
+    def predict_parameters(state: ConversationState, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Predict final search parameters once at most one required field is missing.
+
+        The missing field is left open so a complete result can be narrowed to
+        whatever the user answers next. So is `price_type` until the user says
+        whether they want to buy or rent, instead of the 'rental' default.
+        """
+        missing = ConversationFlowController.get_missing_info(state.user_context)
+        if len(missing) > 1:
+            return None
+        predicted = dict(parameters)
+        if state.user_context.price_type is None:
+            predicted['price_type'] = None
+        return predicted
+
+    @staticmethod
+    def is_compatible(prefetched: Dict[str, Any], final: Dict[str, Any]) -> bool:
+        """Check whether a prefetched search covers the final search parameters"""
+        for key, value in final.items():
+            if key == 'query':
+                continue
+            prefetched_value = prefetched.get(key)
+            if prefetched_value == value:
+                continue
+            if prefetched_value is None and key in SearchPrefetcher.NARROWABLE_PARAMS:
+                continue
+            return False
+        return True
+
+    @staticmethod
+    def is_exact(prefetched: Dict[str, Any], final: Dict[str, Any]) -> bool:
+        """Check whether a prefetched search used exactly the final filters"""
+        return all(prefetched.get(key) == value for key, value in final.items() if key != 'query')
+
+    @staticmethod
+    def is_complete(results: Any) -> bool:
+        """Whether a result set is known to hold every match, so it can be narrowed.
+
+        The backend returns its top N; only a `total` no larger than the
+        returned list proves nothing was cut off.
+        """
+        if not isinstance(results, dict) or 'properties' not in results:
+            return False
+        total = results.get('total')
+        return isinstance(total, int) and total <= len(results['properties'])
+
+    def _has_complete_results(self, prefetch: BackgroundSearch) -> bool:
+        future = prefetch.future
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return False
+        return self.is_complete(future.result())
+
+    @staticmethod
+    def _parse_price(price: Any) -> Optional[int]:
+        if isinstance(price, (int, float)):
+            return int(price)
+        digits = re.sub(r'[^\d]', '', str(price or ''))
+        return int(digits) if digits else None
+
+    @staticmethod
+    def narrow_results(
+        properties: List[Dict],
+        prefetched: Dict[str, Any],
+        final: Dict[str, Any]
+    ) -> List[Dict]:
+        """Filter prefetched properties by the fields the prefetch left open"""
+        narrowed = []
+        for prop in properties:
+            if prefetched.get('location') is None and final.get('location'):
+                if final['location'].lower() not in str(prop.get('location', '')).lower():
+                    continue
+            if prefetched.get('property_type') is None and final.get('property_type'):
+                if str(prop.get('propertyType', '')).lower() != final['property_type']:
+                    continue
+            if prefetched.get('price_max') is None and final.get('price_max'):
+                price = SearchPrefetcher._parse_price(prop.get('price'))
+                if price is None or price > final['price_max']:
+                    continue
+            if prefetched.get('bedrooms') is None and final.get('bedrooms'):
+                if prop.get('bedrooms') != final['bedrooms']:
+                    continue
+            if prefetched.get('bathrooms') is None and final.get('bathrooms'):
+                if prop.get('bathrooms') != final['bathrooms']:
+                    continue
+            if prefetched.get('price_type') is None and final.get('price_type'):
+                if prop.get('priceType') != final['price_type']:
+                    continue
+            narrowed.append(prop)
+        return narrowed
+
+    def discard(self, state: ConversationState, wasted: bool = True):
+        """Cancel and forget the conversation's prefetch.
+
+        Only `wasted` discards count toward the per-conversation cap; replacing
+        an open prefetch with the exact search is planned, not a misprediction.
+        """
+        if state.prefetch is None:
+            return
+        state.prefetch.future.cancel()
+        state.prefetch = None
+        if wasted:
+            state.wasted_prefetches += 1
+            self._count(wasted=1)
+        else:
+            self._count(replaced=1)
+
+    def maybe_prefetch(self, state: ConversationState, parameters: Dict[str, Any]):
+        """Start a background search if the final parameters are predictable"""
+        predicted = self.predict_parameters(state, parameters)
+        if predicted is None:
+            return
+
+        if state.prefetch is not None:
+            existing = state.prefetch.parameters
+            if self.is_compatible(existing, predicted):
+                missing = ConversationFlowController.get_missing_info(state.user_context)
+                if missing or self.is_exact(existing, predicted) or self._has_complete_results(state.prefetch):
+                    return  # Existing prefetch still covers the prediction
+                # All required info is in - an exact search beats narrowing a top-N list
+                self.discard(state, wasted=False)
+            else:
+                self.discard(state)
+
+        if state.wasted_prefetches >= self.max_wasted_per_conversation:
+            self._count(skipped=1)
+            return
+
+        state.prefetch = BackgroundSearch(
+            parameters=predicted,
+            future=self.executor.submit(self.search_backend, predicted),
+            started_at=time.monotonic()
+        )
+        self._count(issued=1)
+
+    def is_ready(self, state: ConversationState, parameters: Dict[str, Any]) -> bool:
+        """Whether the prefetch has finished with results that cover these parameters"""
+        prefetch = state.prefetch
+        if prefetch is None or not prefetch.future.done():
+            return False
+        future = prefetch.future
+        if future.cancelled() or future.exception() is not None:
+            return False
+        if not self.is_compatible(prefetch.parameters, parameters):
+            return False
+
+        results = future.result()
+        if not isinstance(results, dict) or 'properties' not in results:
+            return False
+        if self.is_exact(prefetch.parameters, parameters) or self.is_complete(results):
+            return True
+        properties = self.narrow_results(results['properties'], prefetch.parameters, parameters)
+        return len(properties) == len(results['properties'])
+
+    def take(self, state: ConversationState, parameters: Dict[str, Any]) -> Optional["Future"]:
+        """Hand over a compatible prefetch as a future of narrowed results, or None on a miss"""
+        prefetch = state.prefetch
+        if prefetch is None:
+            return None
+
+        if not self.is_compatible(prefetch.parameters, parameters):
+            self.discard(state)
+            return None
+
+        # Failed, cancelled or still queued behind other searches - a fresh search is no slower
+        future = prefetch.future
+        if future.done():
+            if future.cancelled() or future.exception() is not None:
+                self.discard(state)
+                return None
+        elif not future.running():
+            self.discard(state)
+            return None
+
+        if self.is_exact(prefetch.parameters, parameters):
+            state.prefetch = None
+            self._count(hits=1)
+            return prefetch.future
+
+        # Open fields can only be narrowed locally on a finished result set that is
+        # complete, or that narrowing leaves untouched (it is then also the top N
+        # of the narrower search)
+        results = future.result() if future.done() else None
+        if not isinstance(results, dict) or 'properties' not in results:
+            self.discard(state)
+            return None
+        properties = self.narrow_results(results['properties'], prefetch.parameters, parameters)
+        if not self.is_complete(results) and len(properties) < len(results['properties']):
+            self.discard(state)
+            return None
+
+        state.prefetch = None
+        self._count(hits=1)
+
+        from concurrent.futures import Future
+        narrowed = Future()
+        narrowed.set_result(dict(results, properties=properties))
+        return narrowed
+
+    def record_failed_hit(self, state: ConversationState):
+        """A handed-over prefetch failed after all - count it as wasted, not a hit"""
+        state.wasted_prefetches += 1
+        self._count(hits=-1, wasted=1)
+
+    def submit(self, parameters: Dict[str, Any]) -> "Future":
+        """Run a regular (non-speculative) search on the worker pool"""
+        return self.executor.submit(self.search_backend, parameters)
+
+    @staticmethod
+    def _cache_key(parameters: Dict[str, Any]) -> Tuple:
+        return tuple(sorted((k, v) for k, v in parameters.items() if k != 'query'))
+
+    def cache_results(self, parameters: Dict[str, Any], properties: List[Dict]):
+        """Remember the latest results for these parameters (LRU)"""
+        key = self._cache_key(parameters)
+        with self._lock:
+            self._cache[key] = properties
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def cache_when_done(self, search: BackgroundSearch):
+        """Cache a search's results once it succeeds, even if nobody awaits it"""
+        def store(future: "Future"):
+            if future.cancelled() or future.exception() is not None:
+                return
+            results = future.result()
+            if isinstance(results, dict) and 'properties' in results:
+                self.cache_results(search.parameters, results['properties'])
+
+        search.future.add_done_callback(store)
+
+    def cached_results(self, parameters: Dict[str, Any]) -> Optional[List[Dict]]:
+        key = self._cache_key(parameters)
+        with self._lock:
+            return self._cache.get(key)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 # ============================================================================
 # MAIN AGENT CONTROLLER
 # ============================================================================
@@ -518,11 +1193,29 @@ class ResponseGenerator:
 class MyGFAgentController:
     """Main controller for MyGF AI agent behavior"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        search_backend: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        max_prefetch_workers: int = 4,
+        max_wasted_prefetches: int = 2,
+        turn_budget_ms: Optional[float] = None,
+        pattern_budget_ms: Optional[float] = 50.0
+    ):
         self.intent_classifier = IntentClassifier()
         self.flow_controller = ConversationFlowController()
         self.response_generator = ResponseGenerator()
         self.active_conversations: Dict[str, ConversationState] = {}
+        self.turn_budget_ms = turn_budget_ms  # Default per-turn latency budget
+        self.pattern_budget_ms = pattern_budget_ms  # Per-message regex matching budget
+
+        # Prefetching and deadline-aware searches need direct access to the search backend
+        self.prefetcher: Optional[SearchPrefetcher] = None
+        if search_backend is not None:
+            self.prefetcher = SearchPrefetcher(
+                search_backend,
+                max_workers=max_prefetch_workers,
+                max_wasted_per_conversation=max_wasted_prefetches
+            )
 
     def start_conversation(self, user_id: str, conversation_id: str) -> AgentResponse:
         """Initialize a new conversation"""
@@ -547,9 +1240,18 @@ class MyGFAgentController:
         self,
         conversation_id: str,
         user_message: str,
-        tool_results: Optional[Dict[str, Any]] = None
+        tool_results: Optional[Dict[str, Any]] = None,
+        budget_ms: Optional[float] = None
     ) -> AgentResponse:
-        """Process user message and generate appropriate response"""
+        """Process user message and generate appropriate response.
+
+        `budget_ms` (default: the controller's `turn_budget_ms`) bounds how long
+        this turn may wait on a search before replying with a fallback.
+        """
+        started_at = time.monotonic()
+        if budget_ms is None:
+            budget_ms = self.turn_budget_ms
+        deadline = started_at + budget_ms / 1000.0 if budget_ms is not None else None
 
         # Get conversation state
         state = self.active_conversations.get(conversation_id)
@@ -567,23 +1269,44 @@ class MyGFAgentController:
         })
 
         # Classify intent
-        intent = self.intent_classifier.classify_intent(user_message)
+        match_budget = MatchBudget(time_budget_ms=self.pattern_budget_ms)
+        intent = self.intent_classifier.classify_intent(user_message, match_budget)
         state.current_intent = intent
 
         # Detect buying signals
-        signals = self.intent_classifier.detect_buying_signals(user_message)
+        signals = self.intent_classifier.detect_buying_signals(user_message, match_budget)
         state.detected_signals.extend(signals)
 
         # Extract and update entities
-        entities = self.intent_classifier.extract_entities(user_message)
+        entities = self.intent_classifier.extract_entities(user_message, match_budget)
         for key, value in entities.items():
             setattr(state.user_context, key, value)
 
+        # Snapshot the guard before any search time reaches the clock
+        guard_report = None
+        if match_budget.truncated or match_budget.skipped_patterns or match_budget.exceeded:
+            guard_report = match_budget.report()
+
         # Update qualification score
         state.qualification_score = self.flow_controller.calculate_qualification_score(state)
 
         # Generate response based on current phase
-        response = self._generate_phase_response(state, intent, tool_results)
+        phase = state.current_phase
+        response = self._generate_phase_response(state, intent, tool_results, deadline)
+
+        # Surface truncated or budget-limited classification
+        if guard_report is not None:
+            response.metadata['pattern_guard'] = guard_report
+
+        # Record turns that blew their latency budget
+        elapsed_ms = (time.monotonic() - started_at) * 1000
+        if response.metadata.get('deadline_exceeded') or (budget_ms is not None and elapsed_ms > budget_ms):
+            state.deadline_misses.append({
+                'turn': sum(1 for m in state.message_history if m['role'] == 'user'),
+                'phase': phase.value,
+                'budget_ms': budget_ms,
+                'elapsed_ms': round(elapsed_ms, 1)
+            })
 
         # Determine next phase
         next_phase = self.flow_controller.determine_next_phase(
@@ -592,9 +1315,20 @@ class MyGFAgentController:
             state
         )
 
+        # A failed search is retried on the next message instead of moving on
+        if response.metadata.get('search_failed'):
+            next_phase = ConversationPhase.SEARCH_EXECUTION
+
         state.current_phase = next_phase
         response.next_phase = next_phase
 
+        # Speculatively start the search while the user answers the last question
+        if self.prefetcher:
+            if next_phase in (ConversationPhase.INFO_GATHERING, ConversationPhase.SEARCH_EXECUTION):
+                self.prefetcher.maybe_prefetch(state, self._build_search_parameters(state))
+            else:
+                self.prefetcher.discard(state)
+
         # Add response to history
         state.message_history.append({
             'role': 'assistant',
@@ -609,12 +1343,24 @@ class MyGFAgentController:
         self,
         state: ConversationState,
         intent: Intent,
-        tool_results: Optional[Dict] = None
+        tool_results: Optional[Dict] = None,
+        deadline: Optional[float] = None
     ) -> AgentResponse:
         """Generate response based on current conversation phase"""
 
         phase = state.current_phase
 
+        # Deliver results of a search that missed the previous turn's deadline
+        if state.pending_search is not None and not tool_results:
+            pending = state.pending_search
+            parameters = self._build_search_parameters(state)
+            if self.prefetcher.is_exact(pending.parameters, parameters):
+                return self._await_search(state, pending, deadline, late=True)
+            # The user changed their criteria meanwhile - search with the new ones
+            pending.future.cancel()
+            state.pending_search = None
+            return self._run_search(state, parameters, deadline)
+
         # Greeting phase
         if phase == ConversationPhase.GREETING:
             return AgentResponse(
@@ -637,20 +1383,20 @@ class MyGFAgentController:
 
         # Search execution phase
         if phase == ConversationPhase.SEARCH_EXECUTION:
+            parameters = self._build_search_parameters(state)
+
+            # Finished prefetch results are shown whatever the message was about
+            prefetch_ready = self.prefetcher is not None and self.prefetcher.is_ready(state, parameters)
+
             # Prepare tool call
-            if intent == Intent.PROPERTY_SEARCH:
+            if intent == Intent.PROPERTY_SEARCH or state.search_retry or prefetch_ready:
+                # Run the search ourselves, reusing a compatible speculative search if any
+                if self.prefetcher:
+                    return self._run_search(state, parameters, deadline)
+
                 tool_call = {
                     'tool': 'search_properties',
-                    'parameters': {
-                        'query': state.message_history[-1]['content'],
-                        'location': state.user_context.location,
-                        'price_min': state.user_context.budget_min,
-                        'price_max': state.user_context.budget_max,
-                        'bedrooms': state.user_context.bedrooms,
-                        'bathrooms': state.user_context.bathrooms,
-                        'property_type': state.user_context.property_type,
-                        'price_type': state.user_context.price_type or 'rental'
-                    }
+                    'parameters': parameters
                 }
 
                 return AgentResponse(
@@ -681,6 +1427,120 @@ class MyGFAgentController:
             message="I'm here to help! What would you like to know? 😊"
         )
 
+    def _run_search(
+        self,
+        state: ConversationState,
+        parameters: Dict[str, Any],
+        deadline: Optional[float]
+    ) -> AgentResponse:
+        """Search via a compatible prefetch or a fresh backend call, within the deadline"""
+        future = self.prefetcher.take(state, parameters)
+        prefetch_hit = future is not None
+        if future is None:
+            future = self.prefetcher.submit(parameters)
+        search = BackgroundSearch(parameters=parameters, future=future, started_at=time.monotonic())
+        response = self._await_search(state, search, deadline)
+
+        if prefetch_hit and response.metadata.get('search_failed'):
+            # The prefetch failed after it was handed over - try a regular search
+            self.prefetcher.record_failed_hit(state)
+            prefetch_hit = False
+            search = BackgroundSearch(
+                parameters=parameters,
+                future=self.prefetcher.submit(parameters),
+                started_at=time.monotonic()
+            )
+            response = self._await_search(state, search, deadline)
+
+        response.metadata['prefetch_hit'] = prefetch_hit
+        return response
+
+    def _await_search(
+        self,
+        state: ConversationState,
+        search: BackgroundSearch,
+        deadline: Optional[float],
+        late: bool = False
+    ) -> AgentResponse:
+        """Wait for a background search until the turn deadline, else fall back"""
+        from concurrent.futures import wait
+
+        # Wait separately from result(): a backend that raises TimeoutError
+        # itself (e.g. a socket timeout) has failed, it hasn't missed the deadline
+        timeout = max(deadline - time.monotonic(), 0.0) if deadline is not None else None
+        wait([search.future], timeout=timeout)
+        if not search.future.done():
+            return self._deadline_fallback(state, search)
+        try:
+            results = search.future.result()
+        except Exception:
+            results = {'error': 'search failed'}
+        state.pending_search = None
+
+        if not isinstance(results, dict) or 'properties' not in results:
+            state.search_retry = True
+            return AgentResponse(
+                message=(
+                    "I'm having trouble reaching our listings right now 😔 "
+                    "Just reply when you're ready and I'll run the search again!"
+                ),
+                metadata={'search_failed': True, 'late_results': late}
+            )
+
+        state.search_retry = False
+        properties = results['properties']
+        state.last_search_results = properties
+        self.prefetcher.cache_results(search.parameters, properties)
+        message = self.response_generator.generate_property_presentation(
+            properties,
+            state.user_context
+        )
+        return AgentResponse(message=message, metadata={'late_results': late})
+
+    def _deadline_fallback(self, state: ConversationState, search: BackgroundSearch) -> AgentResponse:
+        """Reply within budget using cached results, or promise results next turn"""
+        cached = self.prefetcher.cached_results(search.parameters)
+        if cached is not None:
+            # The user already has results; the fresh ones refresh the cache for later turns
+            state.pending_search = None
+            self.prefetcher.cache_when_done(search)
+            state.last_search_results = cached
+            message = self.response_generator.generate_property_presentation(
+                cached,
+                state.user_context
+            )
+            return AgentResponse(
+                message=message,
+                metadata={'deadline_exceeded': True, 'cached_results': True}
+            )
+
+        state.pending_search = search
+        return AgentResponse(
+            message=(
+                "Still searching for the best matches for you... ⏳ "
+                "I'll have them ready with your next message!"
+            ),
+            metadata={'deadline_exceeded': True, 'pending_search': True}
+        )
+
+    def _build_search_parameters(self, state: ConversationState) -> Dict[str, Any]:
+        """Build search_properties parameters from the user context"""
+        return {
+            'query': state.message_history[-1]['content'],
+            'location': state.user_context.location,
+            'price_min': state.user_context.budget_min,
+            'price_max': state.user_context.budget_max,
+            'bedrooms': state.user_context.bedrooms,
+            'bathrooms': state.user_context.bathrooms,
+            'property_type': state.user_context.property_type,
+            'price_type': state.user_context.price_type or 'rental'
+        }
+
+    def shutdown(self):
+        """Release background search workers"""
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+
     def get_conversation_state(self, conversation_id: str) -> Optional[ConversationState]:
         """Get current conversation state"""
         return self.active_conversations.get(conversation_id)
@@ -699,6 +1559,7 @@ class MyGFAgentController:
             'detected_signals': [s.value for s in state.detected_signals],
             'message_count': len(state.message_history),
             'properties_shown': len(state.properties_shown),
+            'deadline_misses': state.deadline_misses,
             'message_history': state.message_history
         }
 
@@ -0,0 +1,537 @@
+"""
+MyGF AI Agent Load Simulator
+============================
+Drives MyGFAgentController with many concurrent virtual users to see how the
+controller behaves under release-level load (e.g. 10k simultaneous
+conversations), not just per-call speed.
+
+Virtual users follow scripted and randomized flows through ConversationPhase.
+Any `search_properties` tool call is answered by a local stand-in backend with
+configurable latency and error rate. The report is emitted as JSON.
+
+Usage:
+    python mygf_load_test.py --users 10000 --latency-ms 120 --error-rate 0.02 \\
+        --output load_report.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+from mygf_agent_controller import (
+    MyGFAgentController,
+    ConversationPhase,
+    AgentResponse,
+)
+
+
+# ============================================================================
+# MOCK SEARCH BACKEND
+# ============================================================================
+
+class SearchBackendError(Exception):
+    """Raised by the mock backend to simulate a failed search"""
+
+
+@dataclass
+class MockSearchBackend:
+    """Local stand-in for the backend `search_properties` tool"""
+    latency_ms: float = 100.0
+    jitter_ms: float = 50.0
+    error_rate: float = 0.0
+    max_results: int = 5
+    seed: Optional[int] = None
+    calls: int = 0
+    errors: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        # With --direct-backend, search() runs on the controller's worker threads
+        self._lock = threading.Lock()
+
+    def _sample_latency(self) -> float:
+        """Sample a latency in seconds (never negative)"""
+        with self._lock:
+            latency = self._rng.gauss(self.latency_ms, self.jitter_ms)
+        return max(latency, 0.0) / 1000.0
+
+    def _record_latency(self, started: float):
+        with self._lock:
+            self.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    def _build_results(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a plausible search result for the given parameters"""
+        with self._lock:
+            self.calls += 1
+            if self._rng.random() < self.error_rate:
+                self.errors += 1
+                raise SearchBackendError("search_properties backend unavailable")
+
+            location = parameters.get('location') or 'Nairobi'
+            property_type = parameters.get('property_type') or 'apartment'
+            bedrooms = parameters.get('bedrooms') or self._rng.randint(1, 4)
+            price_max = parameters.get('price_max') or 150000
+            price_type = parameters.get('price_type')
+
+            # Some searches match more than fit in one page, like the real backend's top N
+            total = self._rng.randint(0, self.max_results * 2)
+            properties = []
+            for i in range(min(total, self.max_results)):
+                price = int(price_max * self._rng.uniform(0.6, 1.0))
+                properties.append({
+                    'id': f"mock_{self.calls}_{i}",
+                    'title': f"{bedrooms}BR {property_type.title()} in {location}",
+                    'location': location,
+                    'price': f"{price:,} KSh",
+                    'bedrooms': bedrooms,
+                    'propertyType': property_type,
+                    'priceType': price_type or self._rng.choice(['sale', 'rental']),
+                    'description': 'Spacious unit close to shopping and transport links'
+                })
+
+            return {'properties': properties, 'total': total}
+
+    def search(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking search, for callers running on threads"""
+        started = time.perf_counter()
+        try:
+            time.sleep(self._sample_latency())
+            return self._build_results(parameters)
+        finally:
+            self._record_latency(started)
+
+    async def search_async(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Non-blocking search, for the asyncio virtual users"""
+        started = time.perf_counter()
+        try:
+            await asyncio.sleep(self._sample_latency())
+            return self._build_results(parameters)
+        finally:
+            self._record_latency(started)
+
+
+# ============================================================================
+# CONVERSATION FLOWS
+# ============================================================================
+
+SCRIPTED_FLOWS = [
+    [
+        "Hi",
+        "I'm looking for a 3 bedroom apartment",
+        "In Westlands, under 150k",
+        "Yes, for rent",
+        "Can I see the first one?",
+    ],
+    [
+        "Hello",
+        "I want to buy a house in Karen",
+        "Budget up to 45,000,000",
+        "Which one has the biggest garden? Can we negotiate the best price?",
+    ],
+    [
+        "Good morning",
+        "Need land to purchase",
+        "Kitisuru",
+        "Maximum 20,000,000",
+        "What documents do I need for the paperwork?",
+    ],
+    [
+        "hey",
+        "How does this work?",
+        "I need a 2 bedroom flat in Kilimani under 80k",
+        "When can we view it?",
+    ],
+    [
+        "Hi",
+        "I need a surveyor for a land survey",
+        "In Runda",
+    ],
+]
+
+RANDOM_LOCATIONS = ['Westlands', 'Kilimani', 'Kileleshwa', 'Lavington', 'Karen', 'Runda', 'CBD']
+RANDOM_TYPES = ['apartment', 'house', 'villa', 'land', 'office']
+RANDOM_BUDGETS = ['under 60k', 'max 120k', 'up to 250k', '50k to 90k', 'below 15,000,000']
+RANDOM_FOLLOW_UPS = [
+    "Can I see the first one?",
+    "Is the price flexible? Best price please",
+    "When can I move in?",
+    "Compare the first two properties",
+    "What documents do I need?",
+    "Tell me more about that property",
+    "ok thanks",
+]
+
+
+def random_flow(rng: random.Random) -> List[str]:
+    """Build a randomized flow that supplies search info in a random order"""
+    facts = [
+        f"in {rng.choice(RANDOM_LOCATIONS)}",
+        rng.choice(RANDOM_BUDGETS),
+        f"a {rng.randint(1, 5)} bedroom {rng.choice(RANDOM_TYPES)}",
+    ]
+    rng.shuffle(facts)
+
+    # Users volunteer between one and three facts in their opening request
+    opening_count = rng.randint(1, 3)
+    opening = f"I'm looking for {' '.join(facts[:opening_count])}"
+    flow = [rng.choice(['Hi', 'Hello', 'hey there']), opening]
+    flow.extend(facts[opening_count:])
+    flow.append(rng.choice(['for rent', 'to buy']))
+    flow.extend(rng.sample(RANDOM_FOLLOW_UPS, rng.randint(0, 3)))
+    return flow
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size of this process, where /proc is available"""
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class LoadTestMetrics:
+    """Collects per-turn and per-conversation measurements"""
+    bucket_seconds: float = 1.0
+    started_at: float = field(default_factory=time.perf_counter)
+    turn_latencies_ms: List[float] = field(default_factory=list)
+    controller_errors: int = 0
+    deadline_misses: int = 0
+    conversations_started: int = 0
+    conversations_finished: int = 0
+    phase_reached: Dict[str, int] = field(default_factory=dict)
+    timeline: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    def _bucket(self) -> Dict[str, Any]:
+        """Timeline bucket for the current moment"""
+        index = int((time.perf_counter() - self.started_at) / self.bucket_seconds)
+        if index not in self.timeline:
+            self.timeline[index] = {
+                'turns': 0,
+                'conversations_finished': 0,
+                'phase_reached': {},
+            }
+        return self.timeline[index]
+
+    def record_turn(self, latency_ms: float):
+        self.turn_latencies_ms.append(latency_ms)
+        self._bucket()['turns'] += 1
+
+    def record_conversation(self, phases: List[ConversationPhase]):
+        self.conversations_finished += 1
+        bucket = self._bucket()
+        bucket['conversations_finished'] += 1
+        for phase in set(phases):
+            self.phase_reached[phase.value] = self.phase_reached.get(phase.value, 0) + 1
+            bucket['phase_reached'][phase.value] = bucket['phase_reached'].get(phase.value, 0) + 1
+
+
+# ============================================================================
+# VIRTUAL USERS
+# ============================================================================
+
+class LoadSimulator:
+    """Runs virtual users against a single shared controller"""
+
+    def __init__(
+        self,
+        controller: MyGFAgentController,
+        backend: MockSearchBackend,
+        users: int = 1000,
+        concurrency: Optional[int] = None,
+        ramp_up_seconds: float = 0.0,
+        think_time_ms: float = 0.0,
+        random_flow_ratio: float = 0.5,
+        bucket_seconds: float = 1.0,
+        trace_memory: bool = False,
+        worker_threads: int = 32,
+        seed: Optional[int] = None
+    ):
+        self.controller = controller
+        self.backend = backend
+        self.users = users
+        self.concurrency = concurrency or users
+        self.ramp_up_seconds = ramp_up_seconds
+        self.think_time_ms = think_time_ms
+        self.random_flow_ratio = random_flow_ratio
+        self.trace_memory = trace_memory
+        self.worker_threads = worker_threads
+        self._workers: Optional[ThreadPoolExecutor] = None
+        self.rng = random.Random(seed)
+        self.metrics = LoadTestMetrics(bucket_seconds=bucket_seconds)
+
+    def _pick_flow(self) -> List[str]:
+        if self.rng.random() < self.random_flow_ratio:
+            return random_flow(self.rng)
+        return list(self.rng.choice(SCRIPTED_FLOWS))
+
+    async def _think(self):
+        if self.think_time_ms > 0:
+            await asyncio.sleep(self.rng.expovariate(1000.0 / self.think_time_ms))
+
+    async def _execute_tool_calls(self, response: AgentResponse) -> Optional[Dict[str, Any]]:
+        """Answer the response's tool calls from the mock backend"""
+        for tool_call in response.tool_calls:
+            if tool_call.get('tool') != 'search_properties':
+                continue
+            try:
+                return await self.backend.search_async(tool_call.get('parameters', {}))
+            except SearchBackendError as exc:
+                return {'error': str(exc)}
+        return None
+
+    async def _process(self, conversation_id: str, message: str, **kwargs) -> AgentResponse:
+        """Call the controller, on worker threads if it may block on the backend"""
+        if self._workers is None:
+            return self.controller.process_message(conversation_id, message, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._workers,
+            lambda: self.controller.process_message(conversation_id, message, **kwargs)
+        )
+
+    async def _run_user(self, index: int, semaphore: asyncio.Semaphore):
+        if self.ramp_up_seconds > 0:
+            await asyncio.sleep(self.ramp_up_seconds * index / self.users)
+
+        async with semaphore:
+            conversation_id = f"load_{index}"
+            flow = self._pick_flow()
+            self.controller.start_conversation(user_id=f"user_{index}", conversation_id=conversation_id)
+            self.metrics.conversations_started += 1
+            phases = [ConversationPhase.GREETING]
+
+            for message in flow:
+                await self._think()
+                started = time.perf_counter()
+                try:
+                    response = await self._process(conversation_id, message)
+                    if response.next_phase:
+                        phases.append(response.next_phase)
+                    if response.tool_calls:
+                        tool_results = await self._execute_tool_calls(response)
+                        if tool_results is not None:
+                            response = await self._process(
+                                conversation_id,
+                                "[tool_results]",
+                                tool_results=tool_results
+                            )
+                            if response.next_phase:
+                                phases.append(response.next_phase)
+                except Exception:
+                    self.metrics.controller_errors += 1
+                    break
+                self.metrics.record_turn((time.perf_counter() - started) * 1000)
+
+            state = self.controller.get_conversation_state(conversation_id)
+            if state:
+                self.metrics.deadline_misses += len(state.deadline_misses)
+            self.metrics.record_conversation(phases)
+
+    async def run(self) -> Dict[str, Any]:
+        """Run all virtual users and return the report"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # tracemalloc is exact but slows the controller down several times,
+        # which skews latency; RSS is the cheap default.
+        if self.trace_memory:
+            tracemalloc.start()
+            memory_before, _ = tracemalloc.get_traced_memory()
+        else:
+            memory_before = rss_bytes() or 0
+        # A controller with its own search backend blocks while it waits on searches
+        if self.controller.prefetcher:
+            self._workers = ThreadPoolExecutor(max_workers=self.worker_threads)
+        self.metrics.started_at = time.perf_counter()
+
+        await asyncio.gather(*(self._run_user(i, semaphore) for i in range(self.users)))
+        if self._workers:
+            self._workers.shutdown()
+            self._workers = None
+
+        elapsed = time.perf_counter() - self.metrics.started_at
+        if self.trace_memory:
+            memory_after, memory_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            memory_after = rss_bytes() or 0
+            memory_peak = None
+        return self._build_report(elapsed, memory_before, memory_after, memory_peak)
+
+    def _build_report(
+        self,
+        elapsed: float,
+        memory_before: int,
+        memory_after: int,
+        memory_peak: Optional[int]
+    ) -> Dict[str, Any]:
+        metrics = self.metrics
+        latencies = sorted(metrics.turn_latencies_ms)
+        tool_latencies = sorted(self.backend.latencies_ms)
+        finished = max(metrics.conversations_finished, 1)
+
+        timeline = []
+        cumulative: Dict[str, int] = {}
+        cumulative_finished = 0
+        for index in sorted(metrics.timeline):
+            bucket = metrics.timeline[index]
+            cumulative_finished += bucket['conversations_finished']
+            for phase, count in bucket['phase_reached'].items():
+                cumulative[phase] = cumulative.get(phase, 0) + count
+            timeline.append({
+                't_seconds': round(index * metrics.bucket_seconds, 3),
+                'turns_per_second': round(bucket['turns'] / metrics.bucket_seconds, 2),
+                'conversations_finished': cumulative_finished,
+                'phase_completion_rate': {
+                    phase: round(count / max(cumulative_finished, 1), 4)
+                    for phase, count in sorted(cumulative.items())
+                },
+            })
+
+        return {
+            'config': {
+                'users': self.users,
+                'concurrency': self.concurrency,
+                'ramp_up_seconds': self.ramp_up_seconds,
+                'think_time_ms': self.think_time_ms,
+                'random_flow_ratio': self.random_flow_ratio,
+                'backend_latency_ms': self.backend.latency_ms,
+                'backend_jitter_ms': self.backend.jitter_ms,
+                'backend_error_rate': self.backend.error_rate,
+                'direct_backend': self.controller.prefetcher is not None,
+                'turn_budget_ms': self.controller.turn_budget_ms,
+            },
+            'elapsed_seconds': round(elapsed, 3),
+            'turns': len(latencies),
+            'throughput': {
+                'turns_per_second': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+                'conversations_per_second': round(metrics.conversations_finished / elapsed, 2) if elapsed else 0.0,
+            },
+            'turn_latency_ms': {
+                'p50': round(percentile(latencies, 50), 3),
+                'p95': round(percentile(latencies, 95), 3),
+                'p99': round(percentile(latencies, 99), 3),
+                'max': round(latencies[-1], 3) if latencies else 0.0,
+            },
+            'tool_latency_ms': {
+                'p50': round(percentile(tool_latencies, 50), 3),
+                'p95': round(percentile(tool_latencies, 95), 3),
+                'p99': round(percentile(tool_latencies, 99), 3),
+            },
+            'errors': {
+                'tool_calls': self.backend.calls,
+                'tool_errors': self.backend.errors,
+                'controller_errors': metrics.controller_errors,
+                'deadline_misses': metrics.deadline_misses,
+                'deadline_miss_rate': round(metrics.deadline_misses / len(latencies), 4) if latencies else 0.0,
+            },
+            'prefetch': dict(self.controller.prefetcher.stats) if self.controller.prefetcher else None,
+            'memory': {
+                'source': 'tracemalloc' if self.trace_memory else 'rss',
+                'growth_bytes': memory_after - memory_before,
+                'peak_bytes': memory_peak,
+                'growth_bytes_per_conversation': round((memory_after - memory_before) / finished, 1),
+                'active_conversations': len(self.controller.active_conversations),
+            },
+            'conversations': {
+                'started': metrics.conversations_started,
+                'finished': metrics.conversations_finished,
+                'phase_completion_rate': {
+                    phase: round(count / finished, 4)
+                    for phase, count in sorted(metrics.phase_reached.items())
+                },
+            },
+            'timeline': timeline,
+        }
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test MyGFAgentController with virtual users")
+    parser.add_argument('--users', type=int, default=1000, help="number of virtual users")
+    parser.add_argument('--concurrency', type=int, default=None, help="max simultaneous users (default: all)")
+    parser.add_argument('--ramp-up', type=float, default=0.0, help="seconds over which users start")
+    parser.add_argument('--think-time-ms', type=float, default=0.0, help="mean pause between user messages")
+    parser.add_argument('--random-flow-ratio', type=float, default=0.5, help="share of users on randomized flows")
+    parser.add_argument('--latency-ms', type=float, default=100.0, help="mean mock search latency")
+    parser.add_argument('--jitter-ms', type=float, default=50.0, help="std deviation of mock search latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of mock searches that fail")
+    parser.add_argument('--bucket-seconds', type=float, default=1.0, help="timeline bucket width")
+    parser.add_argument('--direct-backend', action='store_true',
+                        help="give the controller the mock backend (prefetch, deadline-aware search)")
+    parser.add_argument('--turn-budget-ms', type=float, default=None, help="per-turn latency budget")
+    parser.add_argument('--search-workers', type=int, default=4, help="controller search threads with --direct-backend")
+    parser.add_argument('--worker-threads', type=int, default=32, help="controller threads with --direct-backend")
+    parser.add_argument('--trace-memory', action='store_true', help="exact memory via tracemalloc (slower)")
+    parser.add_argument('--seed', type=int, default=None, help="random seed for reproducible runs")
+    parser.add_argument('--output', default='-', help="report path, '-' for stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    backend = MockSearchBackend(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    controller = MyGFAgentController(
+        search_backend=backend.search if args.direct_backend else None,
+        max_prefetch_workers=args.search_workers,
+        turn_budget_ms=args.turn_budget_ms
+    )
+    simulator = LoadSimulator(
+        controller=controller,
+        backend=backend,
+        users=args.users,
+        concurrency=args.concurrency,
+        ramp_up_seconds=args.ramp_up,
+        think_time_ms=args.think_time_ms,
+        random_flow_ratio=args.random_flow_ratio,
+        bucket_seconds=args.bucket_seconds,
+        trace_memory=args.trace_memory,
+        worker_threads=args.worker_threads,
+        seed=args.seed
+    )
+    report = asyncio.run(simulator.run())
+    controller.shutdown()
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as fh:
+            fh.write(output + '\n')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
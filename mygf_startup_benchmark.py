@@ -0,0 +1,118 @@
+"""
+MyGF AI Agent Startup Benchmark
+===============================
+Measures what a freshly started worker pays before it can answer: import time
+of mygf_agent_controller and time to the first process_message, in separate
+processes so nothing is warm.
+
+Scenarios:
+    cold      - lazy state is built by the first message
+    warmup    - warmup() runs before the first message (as in a pre-fork parent)
+
+Usage:
+    python mygf_startup_benchmark.py --runs 20 --output startup_report.json
+"""
+
+import argparse
+import json
+import os
+import py_compile
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Any
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CHILD_SCRIPT = """
+import json, os, time
+started = time.perf_counter()
+import mygf_agent_controller as agent
+imported = time.perf_counter()
+
+warmup_ms = None
+if os.environ.get('MYGF_BENCH_WARMUP'):
+    agent.warmup()
+    warmup_ms = (time.perf_counter() - imported) * 1000
+
+controller = agent.MyGFAgentController()
+controller.start_conversation(user_id='bench', conversation_id='bench')
+before_message = time.perf_counter()
+controller.process_message('bench', "I'm looking for a 3 bedroom apartment in Westlands under 150k")
+done = time.perf_counter()
+
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'warmup_ms': warmup_ms,
+    'first_message_ms': (done - before_message) * 1000,
+    'ready_ms': (done - started) * 1000
+}))
+"""
+
+
+def run_child(env_overrides: Dict[str, str]) -> Dict[str, Any]:
+    """Run one measurement in a fresh interpreter"""
+    env = dict(os.environ)
+    env.update(env_overrides)
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT],
+        cwd=HERE,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples: List[Optional[float]]) -> Optional[Dict[str, float]]:
+    values = sorted(v for v in samples if v is not None)
+    if not values:
+        return None
+    return {
+        'min': round(values[0], 3),
+        'median': round(statistics.median(values), 3),
+        'p95': round(values[min(int(0.95 * len(values)), len(values) - 1)], 3),
+        'max': round(values[-1], 3)
+    }
+
+
+def run_benchmark(runs: int) -> Dict[str, Any]:
+    # Children should load bytecode, not pay for compiling the source
+    py_compile.compile(os.path.join(HERE, 'mygf_agent_controller.py'), doraise=True)
+
+    scenarios = {
+        'cold': {},
+        'warmup': {'MYGF_BENCH_WARMUP': '1'},
+    }
+
+    report: Dict[str, Any] = {'runs': runs, 'python': sys.version.split()[0], 'scenarios': {}}
+    for name, overrides in scenarios.items():
+        samples = [run_child(overrides) for _ in range(runs)]
+        report['scenarios'][name] = {
+            metric: summarize([s[metric] for s in samples])
+            for metric in ('import_ms', 'warmup_ms', 'first_message_ms', 'ready_ms')
+        }
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark mygf_agent_controller startup")
+    parser.add_argument('--runs', type=int, default=10, help="fresh processes per scenario")
+    parser.add_argument('--output', default='-', help="report path, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.runs)
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as fh:
+            fh.write(output + '\n')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())